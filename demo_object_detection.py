@@ -4,12 +4,6 @@ This demonstrates the key feature where if no image source is provided,
 the system automatically uses the webcam.
 """
 
-import sys
-import os
-
-# Add the parent directory to the path so we can import easy_opencv
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 def demo_webcam_fallback():
     """Demonstrate automatic webcam fallback"""
     print("=== Object Detection with Automatic Webcam Fallback ===")
@@ -5,8 +5,15 @@ Provides easy-to-use classes and functions for basic image operations with webca
 
 import cv2
 import numpy as np
+import os
 from typing import Optional, Tuple, Union, List
 
+
+def _is_headless() -> bool:
+    """Check whether EASY_OPENCV_HEADLESS asks to skip window creation"""
+    return os.environ.get('EASY_OPENCV_HEADLESS', '').lower() in ('1', 'true', 'yes')
+
+
 class ImageLoader:
     """Class for loading images with various modes and error handling"""
     
@@ -160,6 +167,9 @@ class ImageDisplayer:
             size: Window size (width, height)
             position: Window position (x, y)
         """
+        if _is_headless():
+            return
+        
         wait = wait if wait is not None else self.default_wait
         
         if size:
@@ -197,6 +207,9 @@ class ImageDisplayer:
         if len(images) != len(titles):
             raise ValueError("Number of images must match number of titles")
         
+        if _is_headless():
+            return
+        
         if grid_size:
             cols, rows = grid_size
             for i, (img, title) in enumerate(zip(images, titles)):
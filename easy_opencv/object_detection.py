@@ -7,6 +7,7 @@ import cv2
 import numpy as np
 import os
 import tarfile
+import threading
 from typing import List, Tuple, Optional, Union
 from .utils import download_file
 
@@ -908,6 +909,29 @@ class DNNObjectDetector:
 
 
 # Legacy function wrappers for backward compatibility
+_legacy_detectors = threading.local()
+
+
+def _get_legacy_detector(detector_class, *args):
+    """
+    Get a cached detector for the legacy wrappers
+    
+    Detectors are cached per thread so repeated calls don't re-parse the
+    cascade XML, while no classifier is ever used by two threads at once.
+    """
+    cache = getattr(_legacy_detectors, 'cache', None)
+    if cache is None:
+        cache = _legacy_detectors.cache = {}
+    
+    key = (detector_class,) + tuple(
+        tuple(arg) if isinstance(arg, list) else arg for arg in args
+    )
+    detector = cache.get(key)
+    if detector is None:
+        detector = cache[key] = detector_class(*args)
+    return detector
+
+
 def detect_faces(image: np.ndarray, scale_factor: float = 1.1,
                 min_neighbors: int = 5, min_size: Tuple[int, int] = (30, 30)) -> List[Tuple[int, int, int, int]]:
     """
@@ -922,7 +946,7 @@ def detect_faces(image: np.ndarray, scale_factor: float = 1.1,
     Returns:
         List[Tuple[int, int, int, int]]: List of face rectangles (x, y, w, h)
     """
-    detector = FaceDetector(scale_factor, min_neighbors, min_size)
+    detector = _get_legacy_detector(FaceDetector, scale_factor, min_neighbors, min_size)
     return detector.detect(image)
 
 
@@ -940,7 +964,7 @@ def detect_eyes(image: np.ndarray, scale_factor: float = 1.1,
     Returns:
         List[Tuple[int, int, int, int]]: List of eye rectangles (x, y, w, h)
     """
-    detector = EyeDetector(scale_factor, min_neighbors, min_size)
+    detector = _get_legacy_detector(EyeDetector, scale_factor, min_neighbors, min_size)
     return detector.detect(image)
 
 
@@ -960,7 +984,8 @@ def detect_objects_cascade(image: np.ndarray, cascade_path: str,
     Returns:
         List[Tuple[int, int, int, int]]: List of object rectangles (x, y, w, h)
     """
-    detector = CascadeDetector(cascade_path, scale_factor, min_neighbors, min_size)
+    detector = _get_legacy_detector(CascadeDetector, cascade_path, scale_factor,
+                                    min_neighbors, min_size)
     return detector.detect(image)
 
 